@@ -1,507 +1,884 @@
-#! python3
-# -*- coding: utf-8 -*-
-import logging
-from logging.handlers import RotatingFileHandler
-import sqlite3
-
-# ----- Logging Configuration -----
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-
-log_formatter = logging.Formatter("%(asctime)s|%(name)s|%(levelname)s\n%(message)s\n")
-
-log_handler = RotatingFileHandler("MDBH Log.log", maxBytes=10000, backupCount=1)
-log_handler.setLevel(logging.DEBUG)
-log_handler.setFormatter(log_formatter)
-
-stream_handler = logging.StreamHandler()
-stream_handler.setFormatter(log_formatter)
-
-logger.addHandler(log_handler)
-logger.addHandler(stream_handler)
-
-
-# noinspection PyBroadException
-class MDBHandler:
-    """
-    Media Database Handler.
-    Designed to allow you or a GUI app to add, delete, update and
-    search entries in a sqlite3 database.
-    """
-    def __init__(self, database):
-        """Connect to/create the database file and create a cursor."""
-        self.connection = sqlite3.connect(database)
-        self.cursor = self.connection.cursor()
-        self.file_name = database
-
-    # ----- Media Table -----
-    def add_entry(self, title, description="", age_rating="", genre="",
-                  season=0, disc_count=1, media_type="", play_time=0, notes=""):
-        """
-        Add an entry to the database, minimum information needed is a Title.
-        """
-        logger.debug(f"MDBHandler.add_entry Adding:\ntitle={title}\n"
-                     f"description={description}\nage_rating={age_rating}\n"
-                     f"genre={genre}\nseason={season}\ndisc_count={disc_count}\n"
-                     f"media_type={media_type}\nplay_time={play_time}\n"
-                     f"notes={notes}")
-        try:
-            with self.connection:
-                self.cursor.execute(
-                    f"INSERT INTO media VALUES (NULL, :title, :description, :age_rating,"
-                    f":genre, :season, :disc_count, :media_type, :play_time, :notes)",
-                    {"title": title, "description": description, "age_rating": age_rating,
-                     "genre": genre, "season": season, "disc_count": disc_count,
-                     "media_type": media_type, "play_time": play_time, "notes": notes})
-                self.connection.commit()
-        except Exception:
-            logger.exception("Error in MCDHandler.add_entry")
-
-    def delete_entry(self, entry):
-        """Delete the media entry with 'rowid'."""
-        logger.debug(f"MDBHandler.delete_entry\nDELETING: {entry[1]}")
-        try:
-            with self.connection:
-                self.cursor.execute(
-                    "DELETE FROM media WHERE rowid=(:rowid)", {"rowid": entry[0]})
-        except Exception:
-            logger.exception("Error in MDBHandler.delete_entry")
-
-    def update_entry(self, table, rowid, title, description, age_rating,
-                     genre, season, disc_count, media_type, play_time, notes):
-        """
-        Update the entry  with 'rowid' in 'table' with new information,
-        usually supplied via gui.
-        :param table: Table name.
-        :param rowid: The integer primary key id.
-        :param title: varchar
-        :param description: varchar
-        :param age_rating: varchar (not an integer due to 'U' and 'PG' classifications.
-        :param genre: varchar
-        :param season: integer
-        :param disc_count: integer
-        :param media_type: varchar
-        :param play_time: integer
-        :param notes: varchar
-        """
-        logger.debug(f"MDBHandler.update_entry\nUpdating:\ntable={table}\n"
-                     f"rowid={rowid}\ntitle={title}\ndescription={description}\n"
-                     f"age_rating={age_rating}\ngenre={genre}\nseason={season}\n"
-                     f"disc_count={age_rating}\nmedia_type={media_type}\n"
-                     f"play_time={play_time}\nnotes={notes}")
-        try:
-            with self.connection:
-                self.cursor.execute(
-                    f"""UPDATE {table}
-                    SET title=(:title),
-                    description=(:description),
-                    age_rating=(:age_rating),
-                    genre=(:genre),
-                    season=(:season),
-                    disc_count=(:disc_count),
-                    media_type=(:media_type),
-                    play_time=(:play_time),
-                    notes=(:notes)
-                    WHERE id=(:rowid)""",
-                    # Data to pass in:
-                    {"rowid": rowid,
-                     "title": title,
-                     "description": description,
-                     "age_rating": age_rating,
-                     "genre": genre,
-                     "season": season,
-                     "disc_count": disc_count,
-                     "media_type": media_type,
-                     "play_time": play_time,
-                     "notes": notes})
-                self.connection.commit()
-        except Exception:
-            logger.exception("Error in MDBHandler.update_entry")
-
-    # ----- Genres Table -----
-    def add_genre(self, genre, description="", examples=""):
-        """
-        Add a genre to the database.
-        :param genre: Name of the genre that appears in combo boxes.
-        :param description: A description of the genre.
-        :param examples: Example media of the genre.
-        """
-        logger.debug(f"MDBHandler.add_genre\nTrying to insert:\n"
-                     f"genre={genre}\ndescription={description}\nexamples={examples}")
-        try:
-            with self.connection:
-                self.cursor.execute(
-                    f"INSERT INTO genres VALUES (NULL, :genre, :description, :examples)",
-                    {"genre": genre, "description": description, "examples": examples})
-                self.connection.commit()
-        except Exception:
-            logger.exception("Error in MDBHandler.add_genre")
-
-    def delete_genre(self, entry):
-        """Removes a genre from the 'genres' table and from all entries with that genre."""
-        try:
-            with self.connection:
-                self.convert_entries(column="genre",
-                                     old_value=entry[1],
-                                     new_value="-DELETED GENRE-")
-                logger.debug(f"MDBHandler.delete_genre\n"
-                             f"Swapped '{entry[1]}' to '-DELETED GENRE-'")
-                self.cursor.execute("DELETE FROM genres WHERE rowid=:rowid",
-                                    {"rowid": entry[0]})
-                logger.debug(f"MDBHandler.delete_genre\nDELETED GENRE: {entry}")
-                self.connection.commit()
-        except Exception:
-            logger.exception("Error in MDBHandler.delete_genre")
-
-    def update_genre(self, rowid, genre, description, examples):
-        """
-        Update the genre with 'rowid' in the database.
-
-        :param rowid: Int id of entry
-        :param genre: Name of the genre (e.g. Action)
-        :param description: A description of the genre.
-        :param examples: An example of the genre (e.g. Die Hard)
-        """
-        logger.debug(f"MDBHandler.update_genre\nUpdating:\nrowid={rowid}\n"
-                     f"genre={genre}\ndescription={description}\n"
-                     f"examples={examples}")
-        try:
-            with self.connection:
-                self.cursor.execute(
-                    """UPDATE genres
-                    SET genre=(:genre),
-                    description=(:description),
-                    examples=(:examples)
-                    WHERE rowid=(:rowid)""",
-                    {"genre": genre,
-                     "description": description,
-                     "examples": examples,
-                     "rowid": rowid})
-                self.connection.commit()
-        except Exception:
-            logger.exception("Error in MDBHandler.update_genre")
-
-    # ----- Media Types Table -----
-    def add_media_type(self, media_type):
-        """
-        Add a media type to the database.
-        :param media_type: Name of the media type (e.g. DVD)
-        :return: None
-        """
-        logger.debug(f"MDBHandler.add_media_type\nmedia_type={media_type}")
-        try:
-            with self.connection:
-                self.cursor.execute(
-                    "INSERT INTO media_types VALUES (NULL, :type)",
-                    {"type": media_type})
-                self.connection.commit()
-        except Exception:
-            logger.exception("Error in MDBHandler.add_media_type")
-
-    def delete_media_type(self, media_type):
-        """
-        Delete 'media_type' from the database and all entries.
-        :param media_type: Name of media type to delete
-        :return: None
-        """
-        try:
-            with self.connection:
-                self.convert_entries(column="media_type",
-                                     old_value=media_type[1],
-                                     new_value="-DELETED MEDIA TYPE-")
-                logger.debug(f"MDBHandler.delete_media_type\n"
-                             f"Swapped '{media_type[1]}' to '-DELETED MEDIA TYPE-'")
-                self.cursor.execute("DELETE FROM media_types WHERE rowid=:rowid",
-                                    {"rowid": media_type[0]})
-                logger.debug(f"MDBHandler.delete_media_type\nDELETED TYPE: {media_type[0]}")
-                self.connection.commit()
-        except Exception:
-            logger.exception("Error in MDBHandler.delete_media_types")
-
-    def update_media_type(self, rowid, media_type):
-        """
-        Update the media type with 'rowid'.
-        :param rowid: Int id of the media type to change.
-        :param media_type: New name to change to.
-        :return: None
-        """
-        try:
-            with self.connection:
-                self.cursor.execute(
-                    """UPDATE media_types
-                    SET type=(:media_type)
-                    WHERE rowid=(:rowid)""",
-                    {"media_type": media_type,
-                     "rowid": rowid})
-                self.connection.commit()
-        except Exception:
-            logger.exception("Error in MDBHandler.update_media_type")
-
-    # ----- Search Function(s) -----
-    def return_all_entries(self, table="media", column="title", count=1000):
-        """
-        Creates a generator to return all entries in a table so they can be iterated over.
-
-        :param table:   Name of the table from which to return entries (defaults to 'media').
-
-        :param column:  Name of the column with the data to return
-                        (defaults to 'title' or use '*' for complete rows).
-
-        :param count:   Acts as a buffer for large data sets, currently defaults to 1000.
-
-        :return:        Yields one row from the results at a time for iteration.
-        """
-        try:
-            with self.connection:
-                self.cursor.execute(f"""SELECT {column} FROM {table} ORDER BY {column}""")
-                while True:
-                    results = self.cursor.fetchmany(count)
-                    if not results:
-                        break
-                    for row in results:
-                        yield row
-        except Exception:
-            logging.exception("Error in MDBHandler.return_all_entries")
-
-    def return_distinct_entries(self, table, column, count=1000):
-        """
-        Generator that yields only distinct entries.
-
-        :param table:  Name of the table to search.
-        :param column: Name of the column to search.
-        :param count:  Memory buffer (defaults to 1000).
-        :return:       Yields one row at a time.
-        """
-        try:
-            with self.connection:
-                self.cursor.execute(f"""SELECT DISTINCT {column} FROM {table} ORDER BY {column}""")
-                while True:
-                    results = self.cursor.fetchmany(count)
-                    if not results:
-                        break
-                    for row in results:
-                        yield row
-        except Exception:
-            logger.exception("Error in MDBHandler.return_distinct_entries")
-
-    def filter_entries(self, table="media", column="title", value="", count=1000):
-        """
-        Create a generator with entries with the given parameters.
-
-        :param table:   Table name to search.
-        :param column:  The column to search.
-        :param value:   And what to search for.
-        :param count:   Acts as a buffer for large data sets, currently defaults to 1000.
-        :return:        A generator with the results inside.
-        """
-        try:
-            logger.debug(f"MDBHandler.filter_entries\n"
-                         f"ran with:\n"
-                         f"table={table}/{type(table)}\n"
-                         f"column={column}/{type(column)}\n"
-                         f"value={value}/{type(value)}s")
-            with self.connection:
-                self.cursor.execute(
-                    f"""SELECT * FROM {table} WHERE {column}=('{value}') ORDER BY {column}""")
-                while True:
-                    results = self.cursor.fetchmany(count)
-                    if not results:
-                        break
-                    for row in results:
-                        yield row
-        except Exception:
-            logger.exception("Error in MDBHandler.filter_entries")
-
-    def search(self, query, column=None, count=1000):
-        """
-        Search for 'query' in the media table, columns title, description, genre, notes.
-
-        If column is not specified checks all columns, even returns partials.
-
-        :param query:   What you are searching for e.g. 'Marvel', 'PS4', '90210'.
-        :param column:  Which column to look in (Optional).
-        :param count:   Acts as a buffer for larger databases (default: 1000).
-        :return:        Returns a generator containing rows from the database,
-                        that have a match to 'query'.
-        """
-        try:
-            with self.connection:
-                if column is None:
-                    self.cursor.execute(
-                        f"""SELECT * FROM media WHERE
-                        title LIKE (:query) OR
-                        description LIKE (:query) OR
-                        genre LIKE (:query) OR
-                        notes LIKE (:query)""",
-                        {"query": f"%{query}%"})
-                    while True:
-                        results = self.cursor.fetchmany(count)
-                        if not results:
-                            break
-                        for row in results:
-                            yield row
-                else:
-                    self.cursor.execute(
-                        f"SELECT * FROM media WHERE {column} LIKE (:query)",
-                        {"query": f"%{query}%"})
-                    while True:
-                        results = self.cursor.fetchmany(count)
-                        if not results:
-                            break
-                        for row in results:
-                            yield row
-        except Exception:
-            logger.exception("Error in MDBHandler.search")
-
-    def select_one_entry(self, table="media", column="title", value=""):
-        """
-        Select a single entry from the database.
-        :param table:  Name of the table to search.
-        :param column: Name of the column.
-        :param value:  Value to find.
-        :return: tuple/one row from the database.
-        """
-        try:
-            with self.connection:
-                self.cursor.execute(f"""SELECT * FROM {table} WHERE {column}=(:value)""",
-                                    {"value": value})
-                entry = self.cursor.fetchone()
-                logger.debug(f"MDBHandler.select_one_entry\n"
-                             f"Table = {table}\nColumn = {column}\nValue = {value}\n"
-                             f"Result = {entry}")
-                return entry
-        except Exception:
-            logger.exception("Error in MDBHandler.select_one_entry")
-
-    # ----- Other Functions -----
-    def check_if_entry_exists(self, table, column, entry):
-        """
-        Check to see if an entry already exists.
-        :param table:   The table to look in.
-        :param column:  The column to check.
-        :param entry:   And what to check for.
-        :return:        True if something is found else False.
-        """
-        try:
-            with self.connection:
-                self.cursor.execute(
-                    f"SELECT * FROM {table} WHERE {column}=(:entry)",
-                    {"entry": entry})
-                if self.cursor.fetchall():
-                    logger.debug(
-                        f"MCDHandler.check_if_entry_exists returned True\n"
-                        f"Table: {table} - Column: {column} - Entry: {entry}")
-                    return True
-                return False
-        except Exception:
-            logger.exception("Error in MCDHandler.check_if_entry_exists")
-
-    def close(self):
-        """Close the cursor and database connections."""
-        try:
-            self.cursor.close()
-            self.connection.close()
-        except Exception:
-            logger.exception("Error in MDBHandler.close")
-
-    def convert_entries(self, column, old_value, new_value):
-        """Update entries with 'old_value' in 'column' and update to 'new_value'
-
-        :param column:
-        :param old_value:
-        :param new_value:
-        """
-        try:
-            with self.connection:
-                self.cursor.execute(
-                    f"UPDATE media SET {column}=:new_value WHERE {column}=:old_value",
-                    {"new_value": new_value, "old_value": old_value})
-                self.connection.commit()
-        except Exception:
-            logger.exception("Error in MDBHandler.convert_entries")
-
-    def count_entries(self):
-        """
-        Counts the media tables entries by media type.
-
-        :return: A string of media types the amount of entries with that type.
-                 e.g. Audio CD: 3, DVD - Movie: 5, etc.
-        """
-        try:
-            with self.connection:
-                self.cursor.execute("SELECT COUNT(*) FROM media")
-                total = self.cursor.fetchone()
-                output = f"Total Media Count: {total[0]} entries\n"
-                for media_type in self.return_distinct_entries(
-                        table="media",
-                        column="media_type"):
-                    self.cursor.execute(
-                        f"SELECT COUNT(*) FROM media WHERE media_type=:type",
-                        {"type": media_type[0]})
-                    count = self.cursor.fetchone()
-                    output += f"{media_type[0]}: {count[0]}, "
-            logger.debug(f"MDBHandler.count_entries returned:\n{output}")
-            return output.rstrip(", ")
-        except Exception:
-            logger.exception("Error in MDBHandler.count_entries")
-
-    def create_tables(self):
-        """
-        Create the base tables of the media database:
-
-        genres: Table columns consists of:
-                id(int), genre(varchar), description(varchar) and examples(varchar).
-        media:  Table columns consists of:
-                id(int), title(varchar), description(varchar), age_rating(varchar),
-                genre(varchar), cast(varchar), season(int), disc_count(int),
-                media_type(varchar) and play_time(int).
-        media_types: Table columns consists of:
-                id(int) and type(varchar).
-        """
-        try:
-            with self.connection:
-                # The media_types table:
-                self.cursor.execute(
-                    f"""CREATE TABLE IF NOT EXISTS media_types (
-                    id INTEGER PRIMARY KEY NOT NULL,
-                    type VARCHAR)""")
-
-                # The genres table:
-                self.cursor.execute(
-                    f"""CREATE TABLE IF NOT EXISTS genres (
-                    id INTEGER PRIMARY KEY,
-                    genre VARCHAR,
-                    description VARCHAR,
-                    examples VARCHAR)""")
-
-                # The main media table:
-                self.cursor.execute(
-                    f"""CREATE TABLE IF NOT EXISTS media (
-                    id INTEGER PRIMARY KEY, 
-                    title VARCHAR NOT NULL,
-                    description VARCHAR,
-                    age_rating VARCHAR,
-                    genre VARCHAR,
-                    season INTEGER,
-                    disc_count INTEGER,
-                    media_type VARCHAR,
-                    play_time INTEGER,
-                    notes VARCHAR)""")
-                self.connection.commit()
-        except Exception:
-            logger.exception("Error in MDBHandler.create_tables")
-
-    def __str__(self):
-        """"""
-        return f"Database: {self.file_name}\nContaining:\n{self.count_entries()}."
-
-
-def main():
-    """"""
-    app = MDBHandler("Media-Database.db")
-    app.create_tables()
-    print(app)
-
-
-if __name__ == "__main__":
-    main()
+#! python3
+# -*- coding: utf-8 -*-
+import atexit
+import contextlib
+import functools
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import os
+import queue
+import sqlite3
+import threading
+
+# ----- Logging Configuration -----
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+log_formatter = logging.Formatter("%(asctime)s|%(name)s|%(levelname)s\n%(message)s\n")
+
+# A large maxBytes keeps rotations rare (10000 rolled the log over every
+# ~30 records, with a seek/tell on every emit). The file only records
+# DEBUG when MDB_DEBUG is set in the environment.
+log_handler = RotatingFileHandler("MDBH Log.log", maxBytes=5 * 1024 * 1024,
+                                  backupCount=2)
+log_handler.setLevel(logging.DEBUG if os.environ.get("MDB_DEBUG")
+                     else logging.INFO)
+log_handler.setFormatter(log_formatter)
+
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(log_formatter)
+
+# Log through a queue so database calls only pay for enqueueing the
+# record; the listener thread does the actual file/stream writes.
+_log_queue = queue.Queue(-1)
+logger.addHandler(QueueHandler(_log_queue))
+
+_log_listener = QueueListener(_log_queue, log_handler, stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+
+# The only identifiers that may be formatted into SQL. Everything else
+# (values to match, search queries, etc.) is passed as a bound parameter.
+_ALLOWED = {
+    "media": {"id", "title", "description", "age_rating", "genre",
+              "season", "disc_count", "media_type", "play_time", "notes", "*"},
+    "genres": {"id", "genre", "description", "examples", "*"},
+    "media_types": {"id", "type", "*"},
+}
+
+
+def _check_identifiers(table, column):
+    """Raise ValueError unless 'table'/'column' are known identifiers."""
+    if column not in _ALLOWED.get(table, ()):
+        raise ValueError(f"Unknown table/column: {table}.{column}")
+
+
+@functools.lru_cache(maxsize=None)
+def _select_sql(table, column, distinct=False):
+    """
+    Build (and memoise) the SELECT statements used by the generator
+    methods, so each (table, column) pair is formatted exactly once and
+    sqlite3's statement cache sees the same string on every call.
+    """
+    _check_identifiers(table, column)
+    keyword = "SELECT DISTINCT" if distinct else "SELECT"
+    # NOCASE matches how the GUI used to sort lists in Python, and the
+    # NOCASE title index serves the ordering for free.
+    return f"{keyword} {column} FROM {table} ORDER BY {column} COLLATE NOCASE"
+
+
+@functools.lru_cache(maxsize=None)
+def _filter_sql(table, column, select="*", order=None):
+    """Build (and memoise) the parameterized SELECT used by filter_entries."""
+    if order is None:
+        order = column
+    _check_identifiers(table, column)
+    _check_identifiers(table, select)
+    _check_identifiers(table, order)
+    return (f"SELECT {select} FROM {table} WHERE {column}=? "
+            f"ORDER BY {order} COLLATE NOCASE")
+
+
+@functools.lru_cache(maxsize=None)
+def _select_one_sql(table, column):
+    """Build (and memoise) the parameterized single-row SELECT."""
+    _check_identifiers(table, column)
+    return f"SELECT * FROM {table} WHERE {column}=?"
+
+
+@functools.lru_cache(maxsize=None)
+def _exists_sql(table, column):
+    """Build (and memoise) the existence check used by check_if_entry_exists."""
+    _check_identifiers(table, column)
+    return f"SELECT 1 FROM {table} WHERE {column}=? LIMIT 1"
+
+
+# One fixed UPDATE per media column, built once at import so
+# convert_entries always executes the same cached statement per column.
+_CONVERT_SQL = {column: f"UPDATE media SET {column}=? WHERE {column}=?"
+                for column in _ALLOWED["media"] if column != "*"}
+
+
+# noinspection PyBroadException
+class MDBHandler:
+    """
+    Media Database Handler.
+    Designed to allow you or a GUI app to add, delete, update and
+    search entries in a sqlite3 database.
+
+    All SQL is either a fixed constant or comes from one of the memoised
+    module-level builders, so repeated GUI calls (loading lists,
+    displaying an entry, searching) always present sqlite3 with a string
+    it has already compiled and the enlarged per-connection statement
+    cache (cached_statements=256) can serve them without re-parsing.
+    """
+    # Fixed SQL kept as constants so sqlite3 compiles each statement once
+    # and serves repeat calls from its per-connection statement cache.
+    _INSERT_MEDIA_SQL = "INSERT INTO media VALUES (NULL,?,?,?,?,?,?,?,?,?)"
+    _INSERT_MEDIA_IF_NEW_SQL = ("INSERT OR IGNORE INTO media "
+                                "VALUES (NULL,?,?,?,?,?,?,?,?,?)")
+    _INSERT_GENRE_SQL = "INSERT INTO genres VALUES (NULL,?,?,?)"
+    _INSERT_MEDIA_TYPE_SQL = "INSERT INTO media_types VALUES (NULL,?)"
+    _DELETE_MEDIA_SQL = "DELETE FROM media WHERE rowid=(:rowid)"
+    _UPDATE_MEDIA_SQL = """UPDATE media
+                    SET title=(:title),
+                    description=(:description),
+                    age_rating=(:age_rating),
+                    genre=(:genre),
+                    season=(:season),
+                    disc_count=(:disc_count),
+                    media_type=(:media_type),
+                    play_time=(:play_time),
+                    notes=(:notes)
+                    WHERE id=(:rowid)"""
+    _COUNT_MEDIA_SQL = "SELECT COUNT(*) FROM media"
+    _COUNT_BY_TYPE_SQL = """SELECT media_type, COUNT(*) FROM media
+                        GROUP BY media_type ORDER BY media_type"""
+    # The media list fetches (id, title) pairs so the GUI can key
+    # entries by integer primary key instead of by title string.
+    _TITLES_SQL = ("SELECT id, title FROM media "
+                   "ORDER BY title COLLATE NOCASE")
+    _TITLES_BY_TYPE_SQL = ("SELECT id, title FROM media "
+                           "WHERE media_type=? "
+                           "ORDER BY title COLLATE NOCASE")
+    # Search results are sorted by title in SQL (NOCASE matches the old
+    # Python-side sort) so the GUI can display them as they arrive.
+    _SEARCH_ALL_SQL = """SELECT * FROM media WHERE
+                        title LIKE (:query) OR
+                        description LIKE (:query) OR
+                        genre LIKE (:query) OR
+                        notes LIKE (:query)
+                        ORDER BY title COLLATE NOCASE"""
+    _SEARCH_FTS_SQL = """SELECT m.* FROM media m
+                        JOIN media_fts f ON m.id = f.rowid
+                        WHERE media_fts MATCH (:query)
+                        ORDER BY m.title COLLATE NOCASE"""
+    # One fixed LIKE statement per search option (None = all columns),
+    # so every search reuses a cached statement instead of formatting
+    # SQL per call.
+    _SEARCH_SQL = {
+        column: (f"SELECT * FROM media WHERE {column} LIKE (:query) "
+                 "ORDER BY title COLLATE NOCASE")
+        for column in ("title", "description", "genre", "notes")
+    }
+    _SEARCH_SQL[None] = _SEARCH_ALL_SQL
+
+    def __init__(self, database, synchronous="NORMAL"):
+        """
+        Connect to/create the database file and tune the connection.
+
+        :param database:    Name of the database file.
+        :param synchronous: Value for 'PRAGMA synchronous' (defaults to
+                            'NORMAL', which is safe in WAL mode; use 'OFF'
+                            for throwaway/in-memory databases).
+        """
+        self.connection = sqlite3.connect(database, cached_statements=256,
+                                          check_same_thread=False)
+        # Tune the connection before anything else touches it: WAL avoids the
+        # rollback-journal double-write and lets readers run alongside a
+        # writer, while the remaining pragmas cut per-commit fsync cost.
+        self.connection.executescript(
+            f"PRAGMA journal_mode=WAL;"
+            f"PRAGMA synchronous={synchronous};"
+            f"PRAGMA temp_store=MEMORY;"
+            f"PRAGMA cache_size=-8000;"
+            f"PRAGMA mmap_size=268435456;"
+            f"PRAGMA journal_size_limit=6144000;"
+            f"PRAGMA busy_timeout=5000;")
+        journal_mode = self.connection.execute("PRAGMA journal_mode").fetchone()
+        logger.debug("MDBHandler.__init__ journal_mode=%s", journal_mode[0])
+        # sqlite3.Row gives callers named column access (row["title"])
+        # without dict-building cost and still supports positional
+        # indexing, so existing entry[0]/entry[1] callers keep working.
+        self.connection.row_factory = sqlite3.Row
+        # Autocommit mode: Python stops issuing implicit BEGINs, so the
+        # only transactions are the explicit ones from transaction().
+        self.connection.isolation_level = None
+        # WAL lets readers run concurrently with a writer, but SQLite
+        # still allows only one writer at a time - serialize our own
+        # writes so GUI worker threads queue up instead of erroring.
+        self._write_lock = threading.Lock()
+        self.file_name = database
+        # Set by create_tables once the FTS index exists; search falls
+        # back to the LIKE scan while this is False.
+        self.fts_enabled = False
+        # Cached output of count_entries; the write methods clear it so
+        # the next call recomputes instead of every call re-querying.
+        self._count_cache = None
+        # Set once create_tables has run, so repeat calls (e.g. from a
+        # second window sharing this handler) skip the schema statements.
+        self._schema_ready = False
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Context manager wrapping a write in BEGIN IMMEDIATE ... COMMIT.
+
+        Every mutating method runs its statements inside one of these,
+        so a multi-statement operation costs one commit (and with
+        synchronous=NORMAL under WAL, at most one fsync) rather than
+        one per statement.
+
+        BEGIN IMMEDIATE takes the write lock up front, so a busy
+        database makes us wait (see busy_timeout) instead of failing a
+        deferred-to-reserved lock upgrade mid-transaction.
+        """
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.connection
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
+        else:
+            self.connection.execute("COMMIT")
+
+    # ----- Media Table -----
+    def add_entry(self, title, description="", age_rating="", genre="",
+                  season=0, disc_count=1, media_type="", play_time=0, notes=""):
+        """
+        Add an entry to the database, minimum information needed is a Title.
+        """
+        self.add_entries([(title, description, age_rating, genre, season,
+                           disc_count, media_type, play_time, notes)])
+
+    def add_entry_if_new(self, title, description="", age_rating="", genre="",
+                         season=0, disc_count=1, media_type="", play_time=0,
+                         notes=""):
+        """
+        Add an entry unless one with the same title already exists.
+
+        INSERT OR IGNORE against the unique title index makes the
+        existence check and the insert one atomic statement, instead of
+        a check-then-insert pair that races if called twice quickly.
+
+        :return: True if the entry was added, False if the title exists.
+        """
+        try:
+            with self._write_lock, self.transaction():
+                cur = self.connection.execute(
+                    self._INSERT_MEDIA_IF_NEW_SQL,
+                    (title, description, age_rating, genre, season,
+                     disc_count, media_type, play_time, notes))
+                added = cur.rowcount == 1
+            if added:
+                self._count_cache = None
+            logger.debug("MDBHandler.add_entry_if_new\n%s: %s",
+                         "ADDED" if added else "ALREADY EXISTS", title)
+            return added
+        except Exception:
+            logger.exception("Error in MDBHandler.add_entry_if_new")
+            return False
+
+    def add_entries(self, rows, chunk=10_000):
+        """
+        Add many entries to the database in a single transaction.
+
+        Batching the inserts means one commit (and one fsync) for the
+        whole load instead of one per row.
+
+        :param rows:  An iterable of 9-tuples matching the media table
+                      columns (title, description, age_rating, genre,
+                      season, disc_count, media_type, play_time, notes).
+        :param chunk: How many rows to hand to executemany at a time.
+        """
+        try:
+            total = 0
+            with self._write_lock, self.transaction():
+                batch = []
+                for row in rows:
+                    batch.append(row)
+                    if len(batch) >= chunk:
+                        self.connection.executemany(
+                            self._INSERT_MEDIA_SQL, batch)
+                        total += len(batch)
+                        batch = []
+                if batch:
+                    self.connection.executemany(self._INSERT_MEDIA_SQL, batch)
+                    total += len(batch)
+            self._count_cache = None
+            logger.debug("MDBHandler.add_entries added %s entries", total)
+            if total > 1000:
+                # A load this size skews the planner statistics; refresh
+                # them before the GUI starts querying again.
+                self.maintain()
+        except Exception:
+            logger.exception("Error in MDBHandler.add_entries")
+
+    def delete_entry(self, entry):
+        """Delete the media entry with 'rowid'."""
+        logger.debug("MDBHandler.delete_entry\nDELETING: %s", entry[1])
+        try:
+            with self._write_lock, self.transaction():
+                self.connection.execute(self._DELETE_MEDIA_SQL, {"rowid": entry[0]})
+            self._count_cache = None
+        except Exception:
+            logger.exception("Error in MDBHandler.delete_entry")
+
+    def update_entry(self, table, rowid, title, description, age_rating,
+                     genre, season, disc_count, media_type, play_time, notes):
+        """
+        Update the entry  with 'rowid' in 'table' with new information,
+        usually supplied via gui.
+        :param table: Table name.
+        :param rowid: The integer primary key id.
+        :param title: varchar
+        :param description: varchar
+        :param age_rating: varchar (not an integer due to 'U' and 'PG' classifications.
+        :param genre: varchar
+        :param season: integer
+        :param disc_count: integer
+        :param media_type: varchar
+        :param play_time: integer
+        :param notes: varchar
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("MDBHandler.update_entry\nUpdating:\ntable=%s\n"
+                         "rowid=%s\ntitle=%s\ndescription=%s\n"
+                         "age_rating=%s\ngenre=%s\nseason=%s\n"
+                         "disc_count=%s\nmedia_type=%s\n"
+                         "play_time=%s\nnotes=%s",
+                         table, rowid, title, description, age_rating, genre,
+                         season, disc_count, media_type, play_time, notes)
+        try:
+            # 'media' is the only table with these columns; keeping the
+            # SQL fixed means one cached statement instead of one per
+            # formatted string.
+            if table != "media":
+                raise ValueError(f"Unknown table: {table}")
+            with self._write_lock, self.transaction():
+                self.connection.execute(
+                    self._UPDATE_MEDIA_SQL,
+                    # Data to pass in:
+                    {"rowid": rowid,
+                     "title": title,
+                     "description": description,
+                     "age_rating": age_rating,
+                     "genre": genre,
+                     "season": season,
+                     "disc_count": disc_count,
+                     "media_type": media_type,
+                     "play_time": play_time,
+                     "notes": notes})
+            self._count_cache = None
+        except Exception:
+            logger.exception("Error in MDBHandler.update_entry")
+
+    # ----- Genres Table -----
+    def add_genre(self, genre, description="", examples=""):
+        """
+        Add a genre to the database.
+        :param genre: Name of the genre that appears in combo boxes.
+        :param description: A description of the genre.
+        :param examples: Example media of the genre.
+        """
+        self.add_genres([(genre, description, examples)])
+
+    def add_genres(self, rows):
+        """
+        Add many genres to the database in a single transaction.
+
+        :param rows: An iterable of (genre, description, examples) tuples.
+        """
+        try:
+            with self._write_lock, self.transaction():
+                cur = self.connection.executemany(self._INSERT_GENRE_SQL, rows)
+            logger.debug("MDBHandler.add_genres added %s genres",
+                         cur.rowcount)
+        except Exception:
+            logger.exception("Error in MDBHandler.add_genres")
+
+    def delete_genre(self, entry):
+        """Removes a genre from the 'genres' table and from all entries with that genre."""
+        try:
+            with self._write_lock, self.transaction():
+                # Inline the conversion so the swap and the delete share
+                # one transaction (and one commit) instead of two.
+                self.connection.execute(_CONVERT_SQL["genre"],
+                                    ("-DELETED GENRE-", entry[1]))
+                logger.debug("MDBHandler.delete_genre\n"
+                             "Swapped '%s' to '-DELETED GENRE-'", entry[1])
+                self.connection.execute("DELETE FROM genres WHERE rowid=:rowid",
+                                    {"rowid": entry[0]})
+                logger.debug("MDBHandler.delete_genre\nDELETED GENRE: %s", entry)
+        except Exception:
+            logger.exception("Error in MDBHandler.delete_genre")
+
+    def update_genre(self, rowid, genre, description, examples):
+        """
+        Update the genre with 'rowid' in the database.
+
+        :param rowid: Int id of entry
+        :param genre: Name of the genre (e.g. Action)
+        :param description: A description of the genre.
+        :param examples: An example of the genre (e.g. Die Hard)
+        """
+        logger.debug("MDBHandler.update_genre\nUpdating:\nrowid=%s\n"
+                     "genre=%s\ndescription=%s\nexamples=%s",
+                     rowid, genre, description, examples)
+        try:
+            with self._write_lock, self.transaction():
+                self.connection.execute(
+                    """UPDATE genres
+                    SET genre=(:genre),
+                    description=(:description),
+                    examples=(:examples)
+                    WHERE rowid=(:rowid)""",
+                    {"genre": genre,
+                     "description": description,
+                     "examples": examples,
+                     "rowid": rowid})
+        except Exception:
+            logger.exception("Error in MDBHandler.update_genre")
+
+    # ----- Media Types Table -----
+    def add_media_type(self, media_type):
+        """
+        Add a media type to the database.
+        :param media_type: Name of the media type (e.g. DVD)
+        :return: None
+        """
+        self.add_media_types([(media_type,)])
+
+    def add_media_types(self, rows):
+        """
+        Add many media types to the database in a single transaction.
+
+        :param rows: An iterable of 1-tuples of media type names.
+        """
+        try:
+            with self._write_lock, self.transaction():
+                cur = self.connection.executemany(self._INSERT_MEDIA_TYPE_SQL,
+                                                  rows)
+            logger.debug("MDBHandler.add_media_types added %s media types",
+                         cur.rowcount)
+        except Exception:
+            logger.exception("Error in MDBHandler.add_media_types")
+
+    def delete_media_type(self, media_type):
+        """
+        Delete 'media_type' from the database and all entries.
+        :param media_type: Name of media type to delete
+        :return: None
+        """
+        try:
+            with self._write_lock, self.transaction():
+                # As in delete_genre: one transaction for the swap + delete.
+                self.connection.execute(_CONVERT_SQL["media_type"],
+                                    ("-DELETED MEDIA TYPE-", media_type[1]))
+                logger.debug("MDBHandler.delete_media_type\n"
+                             "Swapped '%s' to '-DELETED MEDIA TYPE-'",
+                             media_type[1])
+                self.connection.execute("DELETE FROM media_types WHERE rowid=:rowid",
+                                    {"rowid": media_type[0]})
+                logger.debug("MDBHandler.delete_media_type\nDELETED TYPE: %s",
+                             media_type[0])
+            self._count_cache = None
+        except Exception:
+            logger.exception("Error in MDBHandler.delete_media_types")
+
+    def update_media_type(self, rowid, media_type):
+        """
+        Update the media type with 'rowid'.
+        :param rowid: Int id of the media type to change.
+        :param media_type: New name to change to.
+        :return: None
+        """
+        try:
+            with self._write_lock, self.transaction():
+                self.connection.execute(
+                    """UPDATE media_types
+                    SET type=(:media_type)
+                    WHERE rowid=(:rowid)""",
+                    {"media_type": media_type,
+                     "rowid": rowid})
+        except Exception:
+            logger.exception("Error in MDBHandler.update_media_type")
+
+    # ----- Search Function(s) -----
+    def return_all_entries(self, table="media", column="title", count=1000):
+        """
+        Creates a generator to return all entries in a table so they can be iterated over.
+
+        :param table:   Name of the table from which to return entries (defaults to 'media').
+
+        :param column:  Name of the column with the data to return
+                        (defaults to 'title' or use '*' for complete rows).
+
+        :param count:   Sets the cursor's internal fetch batch size
+                        (defaults to 1000).
+
+        :return:        Yields one row from the results at a time for iteration.
+        """
+        try:
+            # A fresh cursor per call keeps concurrent generators from
+            # resetting each other's statements.
+            cur = self.connection.execute(_select_sql(table, column))
+            cur.arraysize = count
+            yield from cur
+        except Exception:
+            logging.exception("Error in MDBHandler.return_all_entries")
+
+    def return_titles(self, media_type=None, count=1000):
+        """
+        Yield (id, title) rows for the media list, title-sorted,
+        optionally restricted to one media type.
+
+        Carrying the id alongside each title lets the caller look
+        entries up by integer primary key afterwards, which is a direct
+        B-tree hit and unambiguous when two entries share a title.
+
+        :param media_type: Only yield entries of this type when given.
+        :param count:      The cursor's internal fetch batch size.
+        :return:           Yields one (id, title) row at a time.
+        """
+        try:
+            if media_type is None:
+                cur = self.connection.execute(self._TITLES_SQL)
+            else:
+                cur = self.connection.execute(self._TITLES_BY_TYPE_SQL,
+                                              (media_type,))
+            cur.arraysize = count
+            yield from cur
+        except Exception:
+            logger.exception("Error in MDBHandler.return_titles")
+
+    def return_distinct_entries(self, table, column, count=1000):
+        """
+        Generator that yields only distinct entries.
+
+        :param table:  Name of the table to search.
+        :param column: Name of the column to search.
+        :param count:  The cursor's internal fetch batch size (defaults to 1000).
+        :return:       Yields one row at a time.
+        """
+        try:
+            cur = self.connection.execute(_select_sql(table, column,
+                                                      distinct=True))
+            cur.arraysize = count
+            yield from cur
+        except Exception:
+            logger.exception("Error in MDBHandler.return_distinct_entries")
+
+    def filter_entries(self, table="media", column="title", value="",
+                       count=1000, select="*", order=None):
+        """
+        Create a generator with entries with the given parameters.
+
+        :param table:   Table name to search.
+        :param column:  The column to search.
+        :param value:   And what to search for.
+        :param count:   The cursor's internal fetch batch size (defaults to 1000).
+        :param select:  The column to return (defaults to '*' for whole
+                        rows); narrowing it saves converting columns the
+                        caller throws away.
+        :param order:   The column to sort by (defaults to the filter
+                        column), done in SQL so callers need not re-sort.
+        :return:        A generator with the results inside.
+        """
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("MDBHandler.filter_entries\n"
+                             "ran with:\n"
+                             "table=%s/%s\n"
+                             "column=%s/%s\n"
+                             "value=%s/%ss",
+                             table, type(table), column, type(column),
+                             value, type(value))
+            cur = self.connection.execute(
+                _filter_sql(table, column, select, order), (value,))
+            cur.arraysize = count
+            yield from cur
+        except Exception:
+            logger.exception("Error in MDBHandler.filter_entries")
+
+    def search(self, query, column=None, count=1000):
+        """
+        Search for 'query' in the media table, columns title, description, genre, notes.
+
+        If column is not specified checks all columns, even returns partials.
+
+        :param query:   What you are searching for e.g. 'Marvel', 'PS4', '90210'.
+        :param column:  Which column to look in (Optional).
+        :param count:   The cursor's internal fetch batch size (default: 1000).
+        :return:        Returns a generator containing rows from the database,
+                        that have a match to 'query'.
+        """
+        try:
+            if column is None and self.fts_enabled and query.strip():
+                # The inverted index answers the all-column search without
+                # scanning the table; quote the query so user punctuation
+                # is not parsed as FTS syntax, with * for prefix matching.
+                match = '"{}"*'.format(query.replace('"', '""'))
+                try:
+                    cur = self.connection.execute(self._SEARCH_FTS_SQL,
+                                                  {"query": match})
+                    cur.arraysize = count
+                    yield from cur
+                    return
+                except sqlite3.OperationalError:
+                    logger.debug("MDBHandler.search FTS failed for %r, "
+                                 "falling back to LIKE", query)
+            cur = self.connection.execute(self._SEARCH_SQL[column],
+                                          {"query": f"%{query}%"})
+            cur.arraysize = count
+            yield from cur
+        except Exception:
+            logger.exception("Error in MDBHandler.search")
+
+    def select_one_entry(self, table="media", column="title", value=""):
+        """
+        Select a single entry from the database.
+        :param table:  Name of the table to search.
+        :param column: Name of the column.
+        :param value:  Value to find.
+        :return: tuple/one row from the database.
+        """
+        try:
+            cur = self.connection.execute(_select_one_sql(table, column),
+                                          (value,))
+            entry = cur.fetchone()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("MDBHandler.select_one_entry\n"
+                             "Table = %s\nColumn = %s\nValue = %s\n"
+                             "Result = %s", table, column, value, entry)
+            return entry
+        except Exception:
+            logger.exception("Error in MDBHandler.select_one_entry")
+
+    # ----- Other Functions -----
+    def check_if_entry_exists(self, table, column, entry):
+        """
+        Check to see if an entry already exists.
+        :param table:   The table to look in.
+        :param column:  The column to check.
+        :param entry:   And what to check for.
+        :return:        True if something is found else False.
+        """
+        try:
+            # LIMIT 1 lets SQLite stop at the first match instead of
+            # materializing every matching row just to test truthiness.
+            cur = self.connection.execute(_exists_sql(table, column),
+                                          (entry,))
+            if cur.fetchone() is not None:
+                logger.debug(
+                    "MCDHandler.check_if_entry_exists returned True\n"
+                    "Table: %s - Column: %s - Entry: %s",
+                    table, column, entry)
+                return True
+            return False
+        except Exception:
+            logger.exception("Error in MCDHandler.check_if_entry_exists")
+
+    def maintain(self):
+        """
+        Run post-import maintenance: refresh the query planner's
+        statistics, checkpoint (and truncate) the WAL file and compact
+        the database file. Intended to be called after bulk loads.
+        """
+        try:
+            with self._write_lock:
+                self.connection.execute("ANALYZE")
+                self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self.connection.execute("VACUUM")
+            logger.debug("MDBHandler.maintain completed")
+        except Exception:
+            logger.exception("Error in MDBHandler.maintain")
+
+    def close(self):
+        """Close the cursor and database connections."""
+        try:
+            self.connection.close()
+        except Exception:
+            logger.exception("Error in MDBHandler.close")
+
+    def convert_entries(self, column, old_value, new_value):
+        """Update entries with 'old_value' in 'column' and update to 'new_value'
+
+        :param column:
+        :param old_value:
+        :param new_value:
+        """
+        try:
+            with self._write_lock, self.transaction():
+                self.connection.execute(_CONVERT_SQL[column],
+                                    (new_value, old_value))
+            self._count_cache = None
+        except Exception:
+            logger.exception("Error in MDBHandler.convert_entries")
+
+    def count_entries(self):
+        """
+        Counts the media tables entries by media type.
+
+        :return: A string of media types the amount of entries with that type.
+                 e.g. Audio CD: 3, DVD - Movie: 5, etc.
+        """
+        try:
+            if self._count_cache is None:
+                # One GROUP BY pass gives every per-type count at once,
+                # instead of one COUNT query per distinct media type.
+                # The result is cached until the next write invalidates
+                # it, so redisplaying the count costs nothing.
+                rows = self.connection.execute(
+                    self._COUNT_BY_TYPE_SQL).fetchall()
+                total = sum(count for _, count in rows)
+                self._count_cache = (
+                    f"Total Media Count: {total} entries\n"
+                    + ", ".join(f"{media_type}: {count}"
+                                for media_type, count in rows))
+            logger.debug("MDBHandler.count_entries returned:\n%s",
+                         self._count_cache)
+            return self._count_cache
+        except Exception:
+            logger.exception("Error in MDBHandler.count_entries")
+
+    def create_tables(self):
+        """
+        Create the base tables of the media database:
+
+        genres: Table columns consists of:
+                id(int), genre(varchar), description(varchar) and examples(varchar).
+        media:  Table columns consists of:
+                id(int), title(varchar), description(varchar), age_rating(varchar),
+                genre(varchar), cast(varchar), season(int), disc_count(int),
+                media_type(varchar) and play_time(int).
+        media_types: Table columns consists of:
+                id(int) and type(varchar).
+
+        Runs the schema statements once per handler; later calls return
+        immediately, so anything sharing this handler can call it freely.
+        """
+        if self._schema_ready:
+            return
+        try:
+            with self._write_lock, self.transaction():
+                # The media_types table:
+                self.connection.execute(
+                    f"""CREATE TABLE IF NOT EXISTS media_types (
+                    id INTEGER PRIMARY KEY NOT NULL,
+                    type VARCHAR)""")
+
+                # The genres table:
+                self.connection.execute(
+                    f"""CREATE TABLE IF NOT EXISTS genres (
+                    id INTEGER PRIMARY KEY,
+                    genre VARCHAR,
+                    description VARCHAR,
+                    examples VARCHAR)""")
+
+                # The main media table:
+                self.connection.execute(
+                    f"""CREATE TABLE IF NOT EXISTS media (
+                    id INTEGER PRIMARY KEY, 
+                    title VARCHAR NOT NULL,
+                    description VARCHAR,
+                    age_rating VARCHAR,
+                    genre VARCHAR,
+                    season INTEGER,
+                    disc_count INTEGER,
+                    media_type VARCHAR,
+                    play_time INTEGER,
+                    notes VARCHAR)""")
+
+                # Indexes for the columns the GUI filters and counts on,
+                # so those lookups seek instead of scanning the table.
+                # (The LIKE '%x%' search still scans by nature.)
+                self.connection.execute(
+                    """CREATE INDEX IF NOT EXISTS idx_media_media_type
+                    ON media(media_type)""")
+                self.connection.execute(
+                    """CREATE INDEX IF NOT EXISTS idx_media_genre
+                    ON media(genre)""")
+                self.connection.execute(
+                    """CREATE INDEX IF NOT EXISTS idx_media_title
+                    ON media(title COLLATE NOCASE)""")
+            try:
+                # Backs add_entry_if_new: with titles unique, INSERT OR
+                # IGNORE replaces the check-then-insert pair. Kept in its
+                # own transaction because a legacy database that already
+                # holds duplicate titles can't build this index, and that
+                # shouldn't roll back the rest of the schema.
+                with self._write_lock, self.transaction():
+                    self.connection.execute(
+                        """CREATE UNIQUE INDEX IF NOT EXISTS ux_media_title
+                        ON media(title)""")
+            except sqlite3.IntegrityError:
+                logger.warning("Duplicate titles in the media table; "
+                               "unique title index not created")
+            self.fts_enabled = self._create_fts()
+            self._schema_ready = True
+        except Exception:
+            logger.exception("Error in MDBHandler.create_tables")
+
+    def _create_fts(self):
+        """
+        Create the full-text index over the searchable media columns,
+        plus the triggers that keep it in sync with the media table.
+
+        :return: True if the FTS index is ready, False when this SQLite
+                 build has no FTS5 support.
+        """
+        try:
+            existed = self.connection.execute(
+                """SELECT 1 FROM sqlite_master
+                WHERE type='table' AND name='media_fts'""").fetchone()
+            with self._write_lock, self.transaction():
+                # External content: the text stays in the media table and
+                # the FTS table only stores the inverted index.
+                self.connection.execute(
+                    """CREATE VIRTUAL TABLE IF NOT EXISTS media_fts
+                    USING fts5(title, description, genre, notes,
+                    content='media', content_rowid='id')""")
+                self.connection.execute(
+                    """CREATE TRIGGER IF NOT EXISTS media_ai
+                    AFTER INSERT ON media BEGIN
+                        INSERT INTO media_fts
+                        (rowid, title, description, genre, notes)
+                        VALUES (new.id, new.title, new.description,
+                                new.genre, new.notes);
+                    END""")
+                self.connection.execute(
+                    """CREATE TRIGGER IF NOT EXISTS media_ad
+                    AFTER DELETE ON media BEGIN
+                        INSERT INTO media_fts
+                        (media_fts, rowid, title, description, genre, notes)
+                        VALUES ('delete', old.id, old.title, old.description,
+                                old.genre, old.notes);
+                    END""")
+                self.connection.execute(
+                    """CREATE TRIGGER IF NOT EXISTS media_au
+                    AFTER UPDATE ON media BEGIN
+                        INSERT INTO media_fts
+                        (media_fts, rowid, title, description, genre, notes)
+                        VALUES ('delete', old.id, old.title, old.description,
+                                old.genre, old.notes);
+                        INSERT INTO media_fts
+                        (rowid, title, description, genre, notes)
+                        VALUES (new.id, new.title, new.description,
+                                new.genre, new.notes);
+                    END""")
+                if not existed:
+                    # Index any rows that predate the FTS table.
+                    self.connection.execute(
+                        "INSERT INTO media_fts(media_fts) VALUES('rebuild')")
+            return True
+        except sqlite3.OperationalError:
+            logger.warning("FTS5 unavailable; search will fall back to "
+                           "LIKE scans")
+            return False
+
+    def __str__(self):
+        """"""
+        return f"Database: {self.file_name}\nContaining:\n{self.count_entries()}."
+
+
+def main():
+    """"""
+    app = MDBHandler("Media-Database.db")
+    app.create_tables()
+    print(app)
+
+
+if __name__ == "__main__":
+    main()